@@ -11,16 +11,21 @@ Role: PyTorch TAC Member (IBM/Red Hat representative)
 """
 
 import asyncio
+import re
+import sqlite3
 import sys
+import time
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import aiohttp
 import click
-from rich.console import Console
+import orjson
+from rich.console import Console, Group
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.table import Table
@@ -41,6 +46,12 @@ class ProjectAnalysis:
     technical_merit: str
     community_engagement: str
     maintainer_credibility: str
+    keywords: FrozenSet[str]  # Analysis keywords found in the description
+    competitive_pressure: str  # "High", "Medium", "Unknown"
+    overlap_concern: str  # "High", "Low", "Unknown"
+    outlook: str  # "FAVORABLE", "NEUTRAL", "UNFAVORABLE", "UNAVAILABLE"
+    credibility: str  # "High", "Medium", "Unknown"
+    archived: bool
 
 
 @dataclass
@@ -57,112 +68,628 @@ class VotingRecommendation:
     raghu_consultation_notes: str
 
 
+@dataclass(slots=True)
+class RepoMetrics:
+    """Flat view of the GitHub data consumed by the project scorers"""
+
+    stars: int
+    forks: int
+    open_issues: int
+    contributor_count: int
+    recent_commits: int  # Within RECENT_COMMIT_DAYS, out of the last 10
+    archived: bool
+    has_wiki: bool
+    has_issues: bool
+    has_description: bool
+    has_license: bool
+    language: Optional[str]
+    owner: str
+    top_contributors: List[str]
+    error: Optional[str] = None  # Set when the repository could not be fetched
+
+
+# On-disk cache of GitHub responses used for conditional (ETag) requests
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "tac_advisor.sqlite"
+
+# Entries are evicted after this long; the daily commit-window URLs would
+# otherwise accumulate forever
+CACHE_MAX_AGE_DAYS = 14
+
+# Start pacing requests once fewer than this many remain in the rate limit window
+RATE_LIMIT_LOW_WATERMARK = 100
+MAX_RATE_LIMIT_BACKOFF = 30.0
+
+# Give up on a GitHub request rather than stall the whole analysis
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+# Transient failures (5xx, secondary rate limits, network errors) are retried
+# with exponential backoff starting at RETRY_BASE_DELAY seconds
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0
+
+# Upper bound on projects analyzed at the same time in batch mode
+MAX_CONCURRENT_ANALYSES = 8
+
+# Commits older than this do not count towards recent activity
+RECENT_COMMIT_DAYS = 30
+
+# Last page number in a GitHub pagination Link header
+LAST_PAGE_RE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Everything the scorers need in a single round trip (requires authentication)
+REPOSITORY_QUERY = """
+query($owner: String!, $name: String!, $since: GitTimestamp!) {
+  repository(owner: $owner, name: $name) {
+    description
+    stargazerCount
+    forkCount
+    isArchived
+    hasWikiEnabled
+    hasIssuesEnabled
+    licenseInfo { key name spdxId }
+    primaryLanguage { name }
+    owner { login }
+    mentionableUsers { totalCount }
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: 10, since: $since) {
+            nodes { author { date } }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Description keywords that drive the competition, overlap, merit and
+# alignment assessments
+DESCRIPTION_KEYWORDS = (
+    "inference",
+    "training",
+    "deployment",
+    "optimization",
+    "distributed",
+    "serving",
+    "research",
+    "experimental",
+    "model",
+    "language",
+    "pytorch",
+    "performance",
+    "scalable",
+    "enterprise",
+)
+
+# A zero-width lookahead reports overlapping keywords too, so one pass over
+# the description matches the result of a separate substring test per keyword
+DESCRIPTION_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, DESCRIPTION_KEYWORDS)) + "))"
+)
+
+
+def description_keywords(description: str) -> FrozenSet[str]:
+    """Find the analysis keywords present in a project description"""
+    return frozenset(
+        match.group(1) for match in DESCRIPTION_KEYWORD_RE.finditer(description.lower())
+    )
+
+
+@lru_cache(maxsize=1024)
+def _parse_github_url(url: str) -> Tuple[str, str]:
+    """Parse GitHub URL to extract owner and repository"""
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https") or parsed.hostname != "github.com":
+        raise ValueError(f"Not a GitHub repository URL: {url}")
+
+    path_parts = parsed.path.strip("/").split("/")
+    if len(path_parts) < 2 or not all(path_parts[:2]):
+        raise ValueError(f"GitHub URL has no owner/repository: {url}")
+    return path_parts[0], path_parts[1]
+
+
+class ResponseCache:
+    """SQLite-backed store of GitHub responses keyed by URL"""
+
+    # Bump whenever the responses table changes; older caches are discarded
+    SCHEMA_VERSION = 3
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        with self._conn:
+            if version != self.SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS responses")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(url TEXT PRIMARY KEY, etag TEXT NOT NULL, body BLOB NOT NULL, "
+                "link TEXT, stored_at REAL NOT NULL)"
+            )
+            self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            self._conn.execute(
+                "DELETE FROM responses WHERE stored_at < ?",
+                (time.time() - CACHE_MAX_AGE_DAYS * 86400,),
+            )
+
+    def get(self, url: str) -> Optional[Tuple[str, bytes, Optional[str]]]:
+        """Return the cached (etag, body, link) entry for a URL, if any"""
+        return self._conn.execute(
+            "SELECT etag, body, link FROM responses WHERE url = ?", (url,)
+        ).fetchone()
+
+    def put(self, url: str, etag: str, body: bytes, link: Optional[str]):
+        """Store a response body along with its ETag and pagination links"""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, etag, body, link, stored_at) VALUES (?, ?, ?, ?, ?)",
+                (url, etag, body, link, time.time()),
+            )
+
+    def close(self):
+        """Close the underlying SQLite connection"""
+        self._conn.close()
+
+
 class GitHubAnalyzer:
     """Analyzes GitHub repositories for project health metrics"""
 
-    def __init__(self, github_token: Optional[str] = None):
+    def __init__(
+        self,
+        github_token: Optional[str] = None,
+        cache_path: Optional[Path] = DEFAULT_CACHE_PATH,
+        console: Optional[Console] = None,
+    ):
         self.github_token = github_token
-        self.console = Console()
+        self.console = console or Console(highlight=False)
+        self.cache = self._open_cache(cache_path)
+        # GitHub budgets each API resource ("core", "graphql", ...) separately,
+        # so the (remaining, reset) state is tracked per resource
+        self.rate_limits: Dict[str, Tuple[int, float]] = {}
+        # Earliest time the next paced request for each resource may be sent
+        self._next_send: Dict[str, float] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "GitHubAnalyzer":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the shared HTTP session and the response cache"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        # Reusing one session keeps TLS connections to api.github.com alive
+        # across every project analyzed
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, ttl_dns_cache=300),
+                timeout=REQUEST_TIMEOUT,
+            )
+        return self._session
+
+    def _open_cache(self, cache_path: Optional[Path]) -> Optional[ResponseCache]:
+        """Open the response cache, running uncached if it is unavailable"""
+        if cache_path is None:
+            return None
+        try:
+            return ResponseCache(cache_path)
+        except (OSError, sqlite3.Error) as e:
+            self.console.print(f"[yellow]Response cache disabled: {e}[/yellow]")
+            return None
 
     async def analyze_repository(self, github_url: str) -> Dict:
         """Analyze a GitHub repository for health metrics"""
 
         owner, repo = self._parse_github_url(github_url)
-        if not owner or not repo:
-            return {"error": "Invalid GitHub URL"}
 
         headers = {}
         if self.github_token:
             headers["Authorization"] = f"token {self.github_token}"
 
-        async with aiohttp.ClientSession() as session:
-            # Get repository information
-            repo_data = await self._github_api_call(
-                session, f"https://api.github.com/repos/{owner}/{repo}", headers
-            )
+        # Truncated to the day so the URL (and its cache entry) is stable
+        since = (
+            datetime.now(timezone.utc) - timedelta(days=RECENT_COMMIT_DAYS)
+        ).strftime("%Y-%m-%dT00:00:00Z")
 
-            # Get recent activity
-            commits_data = await self._github_api_call(
-                session, f"https://api.github.com/repos/{owner}/{repo}/commits", headers
-            )
-
-            # Get issues/PRs
-            issues_data = await self._github_api_call(
-                session, f"https://api.github.com/repos/{owner}/{repo}/issues", headers
-            )
+        # GraphQL returns everything in one request but requires a token
+        if self.github_token:
+            return await self._analyze_repository_graphql(owner, repo, since, headers)
+        return await self._analyze_repository_rest(owner, repo, since, headers)
 
-            # Get contributors
-            contributors_data = await self._github_api_call(
-                session,
-                f"https://api.github.com/repos/{owner}/{repo}/contributors",
-                headers,
-            )
+    async def _analyze_repository_rest(
+        self, owner: str, repo: str, since: str, headers: Dict
+    ) -> Dict:
+        """Collect repository metrics through the REST API"""
+
+        base_url = f"https://api.github.com/repos/{owner}/{repo}"
+
+        # Repository info, recent activity, issues/PRs and contributors
+        # are independent, so fetch them concurrently. Only the last 10
+        # commits are scored, and issues only need a count, which the
+        # pagination Link header provides with per_page=1.
+        (
+            repo_data,
+            commits_data,
+            issue_count,
+            contributor_count,
+            top_contributors,
+        ) = await asyncio.gather(
+            self._github_api_call(base_url, headers),
+            self._github_api_call(
+                f"{base_url}/commits?per_page=10&since={since}", headers
+            ),
+            self._github_count_call(
+                f"{base_url}/issues?state=open&per_page=1", headers
+            ),
+            self._fetch_contributor_count(owner, repo, headers),
+            self._fetch_top_contributors(owner, repo, headers),
+        )
 
         return {
             "repository": repo_data,
             "recent_commits": commits_data,
-            "issues": issues_data,
-            "contributors": contributors_data,
+            "issue_count": issue_count,
+            "contributor_count": contributor_count,
+            "top_contributors": top_contributors,
+        }
+
+    async def _analyze_repository_graphql(
+        self, owner: str, repo: str, since: str, headers: Dict
+    ) -> Dict:
+        """Collect repository metrics with a single GraphQL query"""
+
+        # GraphQL has no contributor ranking, so the top few still come
+        # from a small REST page fetched alongside the query
+        data, top_contributors = await asyncio.gather(
+            self._graphql_query(
+                REPOSITORY_QUERY,
+                {"owner": owner, "name": repo, "since": since},
+                headers,
+            ),
+            self._fetch_top_contributors(owner, repo, headers),
+        )
+        if "error" in data:
+            return {"repository": data}
+
+        repository = data.get("repository")
+        if not repository:
+            return {"repository": {"error": "Repository not found"}}
+
+        # Map onto the REST response shape the scorers expect
+        target = (repository.get("defaultBranchRef") or {}).get("target") or {}
+        history = target.get("history", {}).get("nodes", [])
+        language = repository.get("primaryLanguage") or {}
+
+        return {
+            "repository": {
+                "description": repository.get("description"),
+                "stargazers_count": repository.get("stargazerCount", 0),
+                "forks_count": repository.get("forkCount", 0),
+                "archived": repository.get("isArchived", False),
+                "has_wiki": repository.get("hasWikiEnabled", False),
+                "has_issues": repository.get("hasIssuesEnabled", False),
+                "license": repository.get("licenseInfo"),
+                "language": language.get("name"),
+                "owner": repository.get("owner") or {},
+            },
+            "recent_commits": [
+                {"commit": {"author": node.get("author") or {}}} for node in history
+            ],
+            "issue_count": repository["issues"]["totalCount"]
+            + repository["pullRequests"]["totalCount"],
+            "contributor_count": repository["mentionableUsers"]["totalCount"],
+            "top_contributors": top_contributors,
         }
 
+    async def _fetch_contributor_count(
+        self, owner: str, repo: str, headers: Dict
+    ) -> int:
+        """Count contributors from the last page of a per_page=1 listing"""
+        return await self._github_count_call(
+            f"https://api.github.com/repos/{owner}/{repo}/contributors"
+            "?per_page=1&anon=false",
+            headers,
+        )
+
+    async def _fetch_top_contributors(
+        self, owner: str, repo: str, headers: Dict
+    ) -> List[str]:
+        """Fetch the logins of the three most active contributors"""
+        contributors = await self._github_api_call(
+            f"https://api.github.com/repos/{owner}/{repo}/contributors?per_page=3",
+            headers,
+        )
+        if not isinstance(contributors, list):
+            return []
+        return [c["login"] for c in contributors if "login" in c]
+
     def _parse_github_url(self, url: str) -> Tuple[str, str]:
         """Parse GitHub URL to extract owner and repository"""
-        parsed = urlparse(url)
-        if parsed.hostname != "github.com":
-            return "", ""
+        return _parse_github_url(url)
 
-        path_parts = parsed.path.strip("/").split("/")
-        if len(path_parts) >= 2:
-            return path_parts[0], path_parts[1]
-        return "", ""
-
-    async def _github_api_call(
-        self, session: aiohttp.ClientSession, url: str, headers: Dict
-    ) -> Dict:
+    async def _github_api_call(self, url: str, headers: Dict) -> Dict:
         """Make a GitHub API call with error handling"""
+        data, _ = await self._github_request(url, headers)
+        return data
+
+    async def _github_count_call(self, url: str, headers: Dict) -> int:
+        """Count the items of a per_page=1 listing from its last page number"""
+        data, link = await self._github_request(url, headers)
+        if link:
+            match = LAST_PAGE_RE.search(link)
+            if match:
+                return int(match.group(1))
+        return len(data) if isinstance(data, list) else 0
+
+    async def _graphql_query(
+        self,
+        query: str,
+        variables: Dict,
+        headers: Dict,
+    ) -> Dict:
+        """Run a GitHub GraphQL query with error handling"""
+
         try:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    return {"error": f"HTTP {response.status}"}
+            status, _, body = await self._send(
+                "POST",
+                GITHUB_GRAPHQL_URL,
+                json={"query": query, "variables": variables},
+                headers=headers,
+            )
+            if status != 200:
+                return {"error": f"HTTP {status}"}
+            result = orjson.loads(body)
         except Exception as e:
             return {"error": str(e)}
 
+        if result.get("errors"):
+            return {"error": result["errors"][0].get("message", "GraphQL error")}
+        return result.get("data") or {}
+
+    async def _github_request(
+        self, url: str, headers: Dict
+    ) -> Tuple[Any, Optional[str]]:
+        """Fetch a GitHub URL with ETag revalidation, returning data and Link"""
+        cached = self._cache_get(url)
+        if cached:
+            headers = {**headers, "If-None-Match": cached[0]}
+
+        try:
+            status, response_headers, body = await self._send(
+                "GET", url, headers=headers
+            )
+            if status == 304 and cached:
+                return orjson.loads(cached[1]), cached[2]
+            elif status == 200:
+                etag = response_headers.get("ETag")
+                link = response_headers.get("Link")
+                if etag:
+                    self._cache_put(url, etag, body, link)
+                return orjson.loads(body), link
+            else:
+                return {"error": f"HTTP {status}"}, None
+        except Exception as e:
+            return {"error": str(e)}, None
+
+    def _cache_get(self, url: str) -> Optional[Tuple[str, bytes, Optional[str]]]:
+        """Look up a cached response, disabling the cache if it fails"""
+        if self.cache is None:
+            return None
+        try:
+            return self.cache.get(url)
+        except sqlite3.Error as e:
+            self._disable_cache(e)
+            return None
+
+    def _cache_put(self, url: str, etag: str, body: bytes, link: Optional[str]):
+        """Store a response, disabling the cache if it fails"""
+        if self.cache is None:
+            return
+        try:
+            self.cache.put(url, etag, body, link)
+        except sqlite3.Error as e:
+            self._disable_cache(e)
+
+    def _disable_cache(self, error: sqlite3.Error):
+        """Fall back to uncached requests for the rest of the run"""
+        self.console.print(f"[yellow]Response cache disabled: {error}[/yellow]")
+        self.cache = None
+
+    async def _send(self, method: str, url: str, **kwargs) -> Tuple[int, Any, bytes]:
+        """Send a request, retrying transient failures with exponential backoff"""
+
+        for attempt in range(MAX_RETRIES + 1):
+            await self._respect_rate_limit(self._rate_limit_resource(url))
+            try:
+                async with self._get_session().request(
+                    method, url, **kwargs
+                ) as response:
+                    self._record_rate_limit(response.headers)
+                    body = await response.read()
+                    delay = self._retry_delay(
+                        attempt, response.status, response.headers
+                    )
+                    if delay is None or attempt == MAX_RETRIES:
+                        return response.status, response.headers, body
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == MAX_RETRIES:
+                    raise
+                delay = RETRY_BASE_DELAY * 2**attempt
+
+            await asyncio.sleep(delay)
+
+    def _retry_delay(self, attempt: int, status: int, headers) -> Optional[float]:
+        """Seconds to wait before retrying a response, or None to not retry"""
+
+        if status == 403 and headers.get("X-RateLimit-Remaining") == "0":
+            # Primary rate limit exhausted: only worth waiting for a near reset
+            reset = headers.get("X-RateLimit-Reset", "")
+            wait = float(reset) - time.time() if reset.isdigit() else 0.0
+            return max(wait, 0.0) if wait <= MAX_RATE_LIMIT_BACKOFF else None
+
+        if status == 429 or (status == 403 and "Retry-After" in headers):
+            # Secondary rate limit
+            retry_after = headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                wait = float(retry_after)
+                return wait if wait <= MAX_RATE_LIMIT_BACKOFF else None
+            return RETRY_BASE_DELAY * 2**attempt
+
+        if status >= 500:
+            return RETRY_BASE_DELAY * 2**attempt
+
+        return None
+
+    @staticmethod
+    def _rate_limit_resource(url: str) -> str:
+        """Name of the rate limit bucket a request to this URL draws from"""
+        return "graphql" if url == GITHUB_GRAPHQL_URL else "core"
+
+    def _record_rate_limit(self, headers):
+        """Track the rate limit state reported by GitHub"""
+        remaining = headers.get("X-RateLimit-Remaining", "")
+        reset = headers.get("X-RateLimit-Reset", "")
+        if remaining.isdigit() and reset.isdigit():
+            resource = headers.get("X-RateLimit-Resource", "core")
+            self.rate_limits[resource] = (int(remaining), float(reset))
+
+    async def _respect_rate_limit(self, resource: str):
+        """Spread the remaining quota over the reset window when running low"""
+        if resource not in self.rate_limits:
+            return
+        remaining, reset = self.rate_limits[resource]
+        if remaining >= RATE_LIMIT_LOW_WATERMARK:
+            return
+
+        now = time.time()
+        window = reset - now
+        if window > 0:
+            # Concurrent requests all see the same quota, so each one claims
+            # the next free slot instead of sleeping the same delay and then
+            # sending together
+            interval = min(MAX_RATE_LIMIT_BACKOFF, window / max(remaining, 1))
+            send_at = max(now, self._next_send.get(resource, 0.0)) + interval
+            self._next_send[resource] = send_at
+            delay = send_at - now
+            self.console.print(
+                f"[yellow]GitHub {resource} rate limit low ({remaining} left), "
+                f"waiting {delay:.1f}s[/yellow]"
+            )
+            await asyncio.sleep(delay)
+
 
 class PyTorchEcosystemAnalyzer:
     """Analyzes PyTorch ecosystem projects for strategic fit"""
 
-    def __init__(self):
-        self.console = Console()
-        self.github_analyzer = GitHubAnalyzer()
+    # Known competitive areas in ML/PyTorch ecosystem
+    _COMPETITIVE_KEYWORDS: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        "inference": ("TensorRT", "ONNX Runtime", "TensorFlow Lite"),
+        "training": ("Horovod", "DeepSpeed", "FairScale"),
+        "deployment": ("TorchServe", "MLflow", "Kubeflow"),
+        "optimization": ("TensorRT", "Intel OpenVINO", "Apache TVM"),
+        "distributed": ("Ray", "Dask", "Horovod"),
+    }
+
+    # Known credible organizations in AI/ML space
+    _CREDIBLE_ORGS: ClassVar[FrozenSet[str]] = frozenset(
+        {"pytorch", "facebook", "google", "microsoft", "nvidia", "huggingface"}
+    )
+
+    def __init__(
+        self, github_token: Optional[str] = None, console: Optional[Console] = None
+    ):
+        self.console = console or Console(highlight=False)
+        self.github_analyzer = GitHubAnalyzer(github_token, console=self.console)
+
+    async def __aenter__(self) -> "PyTorchEcosystemAnalyzer":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Release the GitHub analyzer's HTTP session"""
+        await self.github_analyzer.aclose()
 
     async def analyze_project(
         self, project_name: str, github_url: str, description: str = ""
     ) -> ProjectAnalysis:
         """Perform comprehensive project analysis"""
 
-        self.console.print(f"[blue]Analyzing project: {project_name}[/blue]")
+        # Progress chatter is only useful interactively
+        if self.console.is_terminal:
+            self.console.print(f"[blue]Analyzing project: {project_name}[/blue]")
 
-        # GitHub analysis
+        # GitHub analysis, flattened once for all of the scorers
         github_data = await self.github_analyzer.analyze_repository(github_url)
+        metrics = self._extract_metrics(github_data)
 
-        # Calculate health score
-        health_score = self._calculate_health_score(github_data)
+        # Scan the description once for every keyword the assessments use
+        keywords = description_keywords(description)
 
         # Analyze competition and overlap
-        competition_analysis = self._analyze_competition(project_name, description)
-        portfolio_overlap = self._analyze_portfolio_overlap(project_name, description)
+        competition_analysis, competitive_pressure = self._analyze_competition(
+            project_name, keywords
+        )
+        portfolio_overlap, overlap_concern = self._analyze_portfolio_overlap(
+            project_name, keywords
+        )
+
+        # Without GitHub data the remaining scorers would only describe an
+        # empty repo, so only the description-based analysis is kept
+        if metrics.error:
+            unavailable = f"GitHub data unavailable ({metrics.error})"
+            return ProjectAnalysis(
+                name=project_name,
+                description=description,
+                github_url=github_url,
+                health_score=0.0,
+                competition_analysis=competition_analysis,
+                portfolio_overlap=portfolio_overlap,
+                strategic_recommendation="**Strategic Recommendation:**\n"
+                f"- **Overall**: **UNAVAILABLE** - {unavailable}, "
+                "requires manual review",
+                risk_assessment=f"**Risk Assessment**: {unavailable}",
+                technical_merit=f"**Technical Merit**: {unavailable}",
+                community_engagement=f"**Community Engagement**: {unavailable}",
+                maintainer_credibility=f"**Maintainer Credibility**: {unavailable}",
+                keywords=keywords,
+                competitive_pressure=competitive_pressure,
+                overlap_concern=overlap_concern,
+                outlook="UNAVAILABLE",
+                credibility="Unknown",
+                archived=False,
+            )
+
+        # Calculate health score
+        health_score = self._calculate_health_score(metrics)
 
         # Strategic assessments
-        strategic_recommendation = self._generate_strategic_recommendation(
-            project_name, health_score, competition_analysis, portfolio_overlap
+        strategic_recommendation, outlook = self._generate_strategic_recommendation(
+            project_name, health_score, competitive_pressure, overlap_concern
         )
 
-        risk_assessment = self._assess_risks(github_data, competition_analysis)
-        technical_merit = self._assess_technical_merit(github_data, description)
-        community_engagement = self._assess_community_engagement(github_data)
-        maintainer_credibility = self._assess_maintainer_credibility(github_data)
+        risk_assessment = self._assess_risks(metrics, competitive_pressure)
+        technical_merit = self._assess_technical_merit(metrics, keywords)
+        community_engagement = self._assess_community_engagement(metrics)
+        maintainer_credibility, credibility = self._assess_maintainer_credibility(
+            metrics
+        )
 
         return ProjectAnalysis(
             name=project_name,
@@ -176,130 +703,146 @@ class PyTorchEcosystemAnalyzer:
             technical_merit=technical_merit,
             community_engagement=community_engagement,
             maintainer_credibility=maintainer_credibility,
+            keywords=keywords,
+            competitive_pressure=competitive_pressure,
+            overlap_concern=overlap_concern,
+            outlook=outlook,
+            credibility=credibility,
+            archived=metrics.archived,
         )
 
-    def _calculate_health_score(self, github_data: Dict) -> float:
-        """Calculate project health score based on GitHub metrics"""
-
-        if "error" in github_data.get("repository", {}):
-            return 0.0
+    def _extract_metrics(self, github_data: Dict) -> RepoMetrics:
+        """Flatten the raw GitHub responses into the metrics the scorers use"""
 
         repo = github_data.get("repository", {})
         commits = github_data.get("recent_commits", [])
-        contributors = github_data.get("contributors", [])
+
+        recent_commits = 0
+        if isinstance(commits, list):
+            cutoff = datetime.now(timezone.utc) - timedelta(days=RECENT_COMMIT_DAYS)
+            recent_commits = sum(
+                1 for c in commits[:10] if self._is_recent_commit(c, cutoff)
+            )
+
+        return RepoMetrics(
+            stars=repo.get("stargazers_count", 0),
+            forks=repo.get("forks_count", 0),
+            open_issues=github_data.get("issue_count", 0),
+            contributor_count=github_data.get("contributor_count", 0),
+            recent_commits=recent_commits,
+            archived=repo.get("archived", False),
+            has_wiki=repo.get("has_wiki", False),
+            has_issues=repo.get("has_issues", False),
+            has_description=bool(repo.get("description")),
+            has_license=bool(repo.get("license")),
+            language=repo.get("language"),
+            owner=repo.get("owner", {}).get("login", "Unknown"),
+            top_contributors=github_data.get("top_contributors", []),
+            error=repo.get("error"),
+        )
+
+    def _calculate_health_score(self, metrics: RepoMetrics) -> float:
+        """Calculate project health score based on GitHub metrics"""
 
         score = 0.0
 
         # Stars (max 20 points)
-        stars = repo.get("stargazers_count", 0)
-        score += min(20, stars / 100)
+        score += min(20, metrics.stars / 100)
 
         # Recent activity (max 25 points)
-        if commits:
-            recent_commits = len([c for c in commits[:10] if self._is_recent_commit(c)])
-            score += min(25, recent_commits * 2.5)
+        score += min(25, metrics.recent_commits * 2.5)
 
         # Contributors (max 20 points)
-        contributor_count = len(contributors)
-        score += min(20, contributor_count)
+        score += min(20, metrics.contributor_count)
 
         # Maintenance indicators (max 35 points)
-        if not repo.get("archived", False):
+        if not metrics.archived:
             score += 10
-        if repo.get("has_wiki", False):
+        if metrics.has_wiki:
             score += 5
-        if repo.get("has_issues", False):
+        if metrics.has_issues:
             score += 5
-        if repo.get("description"):
+        if metrics.has_description:
             score += 5
-        if repo.get("license"):
+        if metrics.has_license:
             score += 10
 
         return min(100.0, score)
 
-    def _is_recent_commit(self, commit: Dict) -> bool:
-        """Check if commit is recent (within 30 days)"""
+    def _is_recent_commit(self, commit: Dict, cutoff: datetime) -> bool:
+        """Check if commit is recent (authored at or after cutoff)"""
         try:
             commit_date = datetime.fromisoformat(
                 commit["commit"]["author"]["date"].replace("Z", "+00:00")
             )
-            return (datetime.now().astimezone() - commit_date).days <= 30
+            return commit_date >= cutoff
         except (KeyError, ValueError):
             return False
 
-    def _analyze_competition(self, project_name: str, description: str) -> str:
-        """Analyze competitive landscape"""
-
-        # Known competitive areas in ML/PyTorch ecosystem
-        competitive_keywords = {
-            "inference": ["TensorRT", "ONNX Runtime", "TensorFlow Lite"],
-            "training": ["Horovod", "DeepSpeed", "FairScale"],
-            "deployment": ["TorchServe", "MLflow", "Kubeflow"],
-            "optimization": ["TensorRT", "Intel OpenVINO", "Apache TVM"],
-            "distributed": ["Ray", "Dask", "Horovod"],
-        }
-
-        analysis = f"**Competition Analysis for {project_name}:**\n"
-        description_lower = description.lower()
-
-        for category, competitors in competitive_keywords.items():
-            if category in description_lower:
-                analysis += f"- **{category.title()}**: Competes with {', '.join(competitors)}\n"
-
-        analysis += "\n**Market Position**: "
-        if any(
-            keyword in description_lower
-            for keyword in ["inference", "serving", "deployment"]
-        ):
-            analysis += "Highly competitive space with established players"
-        elif any(
-            keyword in description_lower for keyword in ["research", "experimental"]
-        ):
-            analysis += "Research-focused, lower competitive pressure"
+    def _analyze_competition(
+        self, project_name: str, keywords: FrozenSet[str]
+    ) -> Tuple[str, str]:
+        """Analyze competitive landscape, returning the analysis and pressure"""
+
+        parts = [f"**Competition Analysis for {project_name}:**"]
+
+        for category, competitors in self._COMPETITIVE_KEYWORDS.items():
+            if category in keywords:
+                parts.append(
+                    f"- **{category.title()}**: Competes with {', '.join(competitors)}"
+                )
+
+        competitive_pressure = "Medium"
+        if keywords & {"inference", "serving", "deployment"}:
+            market_position = "Highly competitive space with established players"
+            competitive_pressure = "High"
+        elif keywords & {"research", "experimental"}:
+            market_position = "Research-focused, lower competitive pressure"
         else:
-            analysis += "Moderate competitive landscape"
+            market_position = "Moderate competitive landscape"
 
-        return analysis
+        parts.append("")
+        parts.append(f"**Market Position**: {market_position}")
 
-    def _analyze_portfolio_overlap(self, project_name: str, description: str) -> str:
-        """Analyze overlap with Red Hat/IBM portfolio"""
+        return "\n".join(parts), competitive_pressure
 
-        # Red Hat/IBM AI portfolio areas
-        redhat_portfolio = [
-            "OpenShift AI",
-            "Watson",
-            "CodeFlare",
-            "Instructlab",
-            "Granite models",
-            "Red Hat Enterprise Linux AI",
-        ]
-
-        analysis = f"**Portfolio Overlap Analysis:**\n"
-        description_lower = description.lower()
+    def _analyze_portfolio_overlap(
+        self, project_name: str, keywords: FrozenSet[str]
+    ) -> Tuple[str, str]:
+        """Analyze overlap with Red Hat/IBM portfolio and the concern level"""
 
         overlaps = []
-        if "serving" in description_lower or "deployment" in description_lower:
+        if "serving" in keywords or "deployment" in keywords:
             overlaps.append("OpenShift AI serving capabilities")
-        if "training" in description_lower or "distributed" in description_lower:
+        if "training" in keywords or "distributed" in keywords:
             overlaps.append("CodeFlare distributed training")
-        if "model" in description_lower and "language" in description_lower:
+        if "model" in keywords and "language" in keywords:
             overlaps.append("Granite model ecosystem")
 
+        parts = ["**Portfolio Overlap Analysis:**"]
         if overlaps:
-            analysis += f"- **Direct overlaps**: {', '.join(overlaps)}\n"
-            analysis += "- **Strategic concern**: Medium to High\n"
+            parts.append(f"- **Direct overlaps**: {', '.join(overlaps)}")
+            parts.append("- **Strategic concern**: Medium to High")
+            overlap_concern = "High"
         else:
-            analysis += "- **Direct overlaps**: Minimal identified\n"
-            analysis += "- **Strategic concern**: Low\n"
+            parts.append("- **Direct overlaps**: Minimal identified")
+            parts.append("- **Strategic concern**: Low")
+            overlap_concern = "Low"
 
-        analysis += f"- **Synergy potential**: {'High' if 'pytorch' in description_lower else 'Medium'}\n"
+        synergy = "High" if "pytorch" in keywords else "Medium"
+        parts.append(f"- **Synergy potential**: {synergy}")
+        parts.append("")
 
-        return analysis
+        return "\n".join(parts), overlap_concern
 
     def _generate_strategic_recommendation(
-        self, project_name: str, health_score: float, competition: str, overlap: str
-    ) -> str:
-        """Generate strategic recommendation"""
+        self,
+        project_name: str,
+        health_score: float,
+        competitive_pressure: str,
+        overlap_concern: str,
+    ) -> Tuple[str, str]:
+        """Generate strategic recommendation and overall outlook"""
 
         if health_score >= 75:
             health_factor = "Strong project health supports adoption"
@@ -308,39 +851,37 @@ class PyTorchEcosystemAnalyzer:
         else:
             health_factor = "Weak project health raises sustainability concerns"
 
-        competitive_pressure = (
-            "High" if "Highly competitive" in competition else "Medium"
-        )
-        overlap_concern = "High" if "Medium to High" in overlap else "Low"
-
-        recommendation = f"**Strategic Recommendation:**\n"
-        recommendation += f"- **Health Factor**: {health_factor}\n"
-        recommendation += f"- **Competitive Pressure**: {competitive_pressure}\n"
-        recommendation += f"- **Portfolio Overlap**: {overlap_concern} concern level\n"
+        parts = [
+            "**Strategic Recommendation:**",
+            f"- **Health Factor**: {health_factor}",
+            f"- **Competitive Pressure**: {competitive_pressure}",
+            f"- **Portfolio Overlap**: {overlap_concern} concern level",
+        ]
 
         if health_score >= 60 and overlap_concern == "Low":
-            recommendation += "- **Overall**: **FAVORABLE** for ecosystem inclusion"
+            outlook = "FAVORABLE"
+            parts.append("- **Overall**: **FAVORABLE** for ecosystem inclusion")
         elif health_score >= 40:
-            recommendation += "- **Overall**: **NEUTRAL** - requires deeper analysis"
+            outlook = "NEUTRAL"
+            parts.append("- **Overall**: **NEUTRAL** - requires deeper analysis")
         else:
-            recommendation += "- **Overall**: **UNFAVORABLE** - significant concerns"
+            outlook = "UNFAVORABLE"
+            parts.append("- **Overall**: **UNFAVORABLE** - significant concerns")
 
-        return recommendation
+        return "\n".join(parts), outlook
 
-    def _assess_risks(self, github_data: Dict, competition: str) -> str:
+    def _assess_risks(self, metrics: RepoMetrics, competitive_pressure: str) -> str:
         """Assess project risks"""
 
         risks = []
 
-        repo = github_data.get("repository", {})
-        if repo.get("archived"):
+        if metrics.archived:
             risks.append("Project is archived")
 
-        contributors = github_data.get("contributors", [])
-        if len(contributors) < 3:
+        if metrics.contributor_count < 3:
             risks.append("Bus factor - too few contributors")
 
-        if "Highly competitive" in competition:
+        if competitive_pressure == "High":
             risks.append("High competitive pressure may limit adoption")
 
         if not risks:
@@ -348,17 +889,17 @@ class PyTorchEcosystemAnalyzer:
 
         return f"**Risk Assessment**:\n" + "\n".join(f"- {risk}" for risk in risks)
 
-    def _assess_technical_merit(self, github_data: Dict, description: str) -> str:
+    def _assess_technical_merit(
+        self, metrics: RepoMetrics, keywords: FrozenSet[str]
+    ) -> str:
         """Assess technical merit"""
 
-        repo = github_data.get("repository", {})
-
         merit_factors = []
-        if repo.get("language") == "Python":
+        if metrics.language == "Python":
             merit_factors.append("Python-based (PyTorch ecosystem aligned)")
-        if "performance" in description.lower():
+        if "performance" in keywords:
             merit_factors.append("Performance-focused")
-        if "scalable" in description.lower():
+        if "scalable" in keywords:
             merit_factors.append("Scalability considerations")
 
         if not merit_factors:
@@ -368,15 +909,12 @@ class PyTorchEcosystemAnalyzer:
             f"- {factor}" for factor in merit_factors
         )
 
-    def _assess_community_engagement(self, github_data: Dict) -> str:
+    def _assess_community_engagement(self, metrics: RepoMetrics) -> str:
         """Assess community engagement"""
 
-        repo = github_data.get("repository", {})
-        issues = github_data.get("issues", [])
-
-        stars = repo.get("stargazers_count", 0)
-        forks = repo.get("forks_count", 0)
-        open_issues = len(issues)
+        stars = metrics.stars
+        forks = metrics.forks
+        open_issues = metrics.open_issues
 
         engagement_level = "Low"
         if stars > 1000 or forks > 100:
@@ -386,41 +924,74 @@ class PyTorchEcosystemAnalyzer:
 
         return f"**Community Engagement**: {engagement_level} ({stars} stars, {forks} forks, {open_issues} open issues)"
 
-    def _assess_maintainer_credibility(self, github_data: Dict) -> str:
+    def _assess_maintainer_credibility(self, metrics: RepoMetrics) -> Tuple[str, str]:
         """Assess maintainer credibility"""
 
-        repo = github_data.get("repository", {})
-        contributors = github_data.get("contributors", [])
-
-        owner = repo.get("owner", {}).get("login", "Unknown")
-        top_contributors = contributors[:3] if contributors else []
-
-        # Known credible organizations in AI/ML space
-        credible_orgs = [
-            "pytorch",
-            "facebook",
-            "google",
-            "microsoft",
-            "nvidia",
-            "huggingface",
-        ]
+        owner = metrics.owner
+        owner_lower = owner.lower()
 
-        if any(org in owner.lower() for org in credible_orgs):
-            credibility = "High - established organization"
-        elif len(contributors) >= 10:
-            credibility = "Medium - active contributor base"
+        if any(org in owner_lower for org in self._CREDIBLE_ORGS):
+            credibility, reason = "High", "established organization"
+        elif metrics.contributor_count >= 10:
+            credibility, reason = "Medium", "active contributor base"
         else:
-            credibility = "Unknown - requires investigation"
+            credibility, reason = "Unknown", "requires investigation"
 
-        return f"**Maintainer Credibility**: {credibility} (Owner: {owner})"
+        details = f"Owner: {owner}"
+        if metrics.top_contributors:
+            details += f"; top contributors: {', '.join(metrics.top_contributors)}"
+
+        return (
+            f"**Maintainer Credibility**: {credibility} - {reason} ({details})",
+            credibility,
+        )
 
 
 class PyTorchTACAdvisor:
     """Main PyTorch TAC voting advisor"""
 
-    def __init__(self):
-        self.console = Console()
-        self.analyzer = PyTorchEcosystemAnalyzer()
+    def __init__(self, github_token: Optional[str] = None, quiet: bool = False):
+        # Auto-highlighting runs regexes over every printed string, which only
+        # adds noise to the long markdown sections
+        self.console = Console(quiet=quiet, highlight=False)
+        self.analyzer = PyTorchEcosystemAnalyzer(github_token, console=self.console)
+
+    async def __aenter__(self) -> "PyTorchTACAdvisor":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Release network resources held by the analyzer"""
+        await self.analyzer.aclose()
+
+    async def analyze_projects(
+        self, specs: List[Dict[str, str]], concurrency: int = MAX_CONCURRENT_ANALYSES
+    ) -> List[Union[VotingRecommendation, Exception]]:
+        """Generate recommendations for several projects concurrently
+
+        Each spec holds the keyword arguments of generate_voting_recommendation.
+        Results are returned in the same order as the specs; a project whose
+        analysis raised is returned as the exception so that one failure does
+        not discard the rest of the batch.
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def analyze(spec: Dict[str, str]) -> VotingRecommendation:
+            async with semaphore:
+                return await self.generate_voting_recommendation(**spec)
+
+        results = await asyncio.gather(
+            *(analyze(spec) for spec in specs), return_exceptions=True
+        )
+
+        # Only ordinary errors are per-project; cancellation still propagates
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+        return results
 
     async def generate_voting_recommendation(
         self,
@@ -431,14 +1002,15 @@ class PyTorchTACAdvisor:
     ) -> VotingRecommendation:
         """Generate comprehensive voting recommendation"""
 
-        self.console.print(
-            Panel(
-                f"[bold blue]PyTorch TAC Voting Analysis[/bold blue]\n"
-                f"Project: {project_name}\n"
-                f"Analyst: Jeremy Eder, Distinguished Engineer, Red Hat",
-                title="Strategic Analysis",
+        if self.console.is_terminal:
+            self.console.print(
+                Panel(
+                    f"[bold blue]PyTorch TAC Voting Analysis[/bold blue]\n"
+                    f"Project: {project_name}\n"
+                    f"Analyst: Jeremy Eder, Distinguished Engineer, Red Hat",
+                    title="Strategic Analysis",
+                )
             )
-        )
 
         # Perform project analysis
         analysis = await self.analyzer.analyze_project(
@@ -476,12 +1048,9 @@ class PyTorchTACAdvisor:
     def _determine_vote(self, analysis: ProjectAnalysis) -> str:
         """Determine voting recommendation"""
 
-        health_score = analysis.health_score
-
-        # Parse strategic recommendation
-        if "FAVORABLE" in analysis.strategic_recommendation:
+        if analysis.outlook == "FAVORABLE":
             return "APPROVE"
-        elif "UNFAVORABLE" in analysis.strategic_recommendation:
+        elif analysis.outlook == "UNFAVORABLE":
             return "REJECT"
         else:
             return "ABSTAIN"
@@ -506,7 +1075,7 @@ class PyTorchTACAdvisor:
 ## Executive Summary
 
 **Recommendation**: {recommendation}  
-**Project Health Score**: {analysis.health_score:.1f}/100  
+**Project Health Score**: {self._format_health_score(analysis)}  
 **Strategic Alignment**: {'Favorable' if recommendation == 'APPROVE' else 'Concerning' if recommendation == 'REJECT' else 'Neutral'}
 
 ## Key Assessment
@@ -542,26 +1111,41 @@ This analysis considers Red Hat's AI strategy, IBM Research priorities, and PyTo
 
         return summary
 
+    def _format_health_score(
+        self, analysis: ProjectAnalysis, rating: bool = False
+    ) -> str:
+        """Render the health score, or note that it could not be measured"""
+
+        if analysis.outlook == "UNAVAILABLE":
+            return "Unavailable (GitHub data could not be fetched)"
+
+        score = f"{analysis.health_score:.1f}/100"
+        if rating:
+            score += " - Strong" if analysis.health_score >= 60 else " - Weak"
+        return score
+
     def _extract_key_factors(self, analysis: ProjectAnalysis) -> List[str]:
         """Extract key decision factors"""
 
         factors = []
 
-        if analysis.health_score >= 70:
+        if analysis.outlook == "UNAVAILABLE":
+            factors.append("GitHub data unavailable - manual review required")
+        elif analysis.health_score >= 70:
             factors.append(f"Strong project health ({analysis.health_score:.1f}/100)")
         elif analysis.health_score <= 30:
             factors.append(f"Weak project health ({analysis.health_score:.1f}/100)")
 
-        if "Medium to High" in analysis.portfolio_overlap:
+        if analysis.overlap_concern == "High":
             factors.append("Significant portfolio overlap concerns")
 
-        if "Highly competitive" in analysis.competition_analysis:
+        if analysis.competitive_pressure == "High":
             factors.append("Operates in highly competitive market")
 
-        if "High - established organization" in analysis.maintainer_credibility:
+        if analysis.credibility == "High":
             factors.append("Credible maintainer organization")
 
-        if "archived" in analysis.risk_assessment.lower():
+        if analysis.archived:
             factors.append("Project maintenance risks identified")
 
         return factors
@@ -569,36 +1153,46 @@ This analysis considers Red Hat's AI strategy, IBM Research priorities, and PyTo
     def _assess_red_hat_alignment(self, analysis: ProjectAnalysis) -> str:
         """Assess alignment with Red Hat strategy"""
 
-        alignment = "**Red Hat Strategic Alignment:**\n"
-
-        if "serving" in analysis.description.lower():
-            alignment += "- Aligns with OpenShift AI serving strategy\n"
-            alignment += "- **Score**: High alignment\n"
-        elif "pytorch" in analysis.description.lower():
-            alignment += "- Supports PyTorch ecosystem that powers RHOAI\n"
-            alignment += "- **Score**: Medium-High alignment\n"
+        if "serving" in analysis.keywords:
+            rationale = "Aligns with OpenShift AI serving strategy"
+            score = "High"
+        elif "pytorch" in analysis.keywords:
+            rationale = "Supports PyTorch ecosystem that powers RHOAI"
+            score = "Medium-High"
         else:
-            alignment += "- General AI ecosystem benefit\n"
-            alignment += "- **Score**: Medium alignment\n"
-
-        return alignment
+            rationale = "General AI ecosystem benefit"
+            score = "Medium"
+
+        return "\n".join(
+            [
+                "**Red Hat Strategic Alignment:**",
+                f"- {rationale}",
+                f"- **Score**: {score} alignment",
+                "",
+            ]
+        )
 
     def _assess_ibm_alignment(self, analysis: ProjectAnalysis) -> str:
         """Assess alignment with IBM strategy"""
 
-        alignment = "**IBM Strategic Alignment:**\n"
-
-        if "research" in analysis.description.lower():
-            alignment += "- Aligns with IBM Research priorities\n"
-            alignment += "- **Score**: High alignment\n"
-        elif "enterprise" in analysis.description.lower():
-            alignment += "- Supports Watson and enterprise AI\n"
-            alignment += "- **Score**: Medium-High alignment\n"
+        if "research" in analysis.keywords:
+            rationale = "Aligns with IBM Research priorities"
+            score = "High"
+        elif "enterprise" in analysis.keywords:
+            rationale = "Supports Watson and enterprise AI"
+            score = "Medium-High"
         else:
-            alignment += "- Contributes to broader AI ecosystem\n"
-            alignment += "- **Score**: Medium alignment\n"
-
-        return alignment
+            rationale = "Contributes to broader AI ecosystem"
+            score = "Medium"
+
+        return "\n".join(
+            [
+                "**IBM Strategic Alignment:**",
+                f"- {rationale}",
+                f"- **Score**: {score} alignment",
+                "",
+            ]
+        )
 
     def _generate_raghu_consultation_notes(
         self, analysis: ProjectAnalysis, recommendation: str
@@ -608,7 +1202,7 @@ This analysis considers Red Hat's AI strategy, IBM Research priorities, and PyTo
         notes = f"""**Consultation Notes for Raghu Ganti (IBM Research):**
 
 **Recommended Discussion Points:**
-1. Project health score: {analysis.health_score:.1f}/100 - {'Strong' if analysis.health_score >= 60 else 'Weak'}
+1. Project health score: {self._format_health_score(analysis, rating=True)}
 2. IBM Research alignment opportunities
 3. Potential collaboration with Watson/Granite teams
 4. Long-term maintenance sustainability
@@ -629,8 +1223,13 @@ This analysis considers Red Hat's AI strategy, IBM Research priorities, and PyTo
     def display_recommendation(self, recommendation: VotingRecommendation):
         """Display formatted recommendation to console"""
 
+        if self.console.quiet:
+            return
+
+        renderables = []
+
         # Main recommendation panel
-        self.console.print(
+        renderables.append(
             Panel(
                 f"[bold]Recommendation: {recommendation.recommendation}[/bold]\n"
                 f"Confidence: {recommendation.confidence}\n"
@@ -654,13 +1253,13 @@ This analysis considers Red Hat's AI strategy, IBM Research priorities, and PyTo
             for factor in recommendation.key_factors:
                 table.add_row(factor)
 
-            self.console.print(table)
+            renderables.append(table)
 
         # Executive summary
-        self.console.print(Markdown(recommendation.executive_summary))
+        renderables.append(Markdown(recommendation.executive_summary))
 
         # Alignment assessments
-        self.console.print(
+        renderables.append(
             Panel(
                 f"{recommendation.red_hat_alignment}\n\n{recommendation.ibm_alignment}",
                 title="Strategic Alignment",
@@ -668,87 +1267,197 @@ This analysis considers Red Hat's AI strategy, IBM Research priorities, and PyTo
         )
 
         # Raghu consultation
-        self.console.print(
+        renderables.append(
             Panel(
                 recommendation.raghu_consultation_notes,
                 title="IBM Research Consultation",
             )
         )
 
+        # Render everything in a single pass
+        self.console.print(Group(*renderables))
+
     def save_analysis(self, recommendation: VotingRecommendation, output_path: str):
         """Save analysis to file"""
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{recommendation.project_name.replace(' ', '_')}_{timestamp}.md"
-        filepath = Path(output_path) / filename
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        stem = f"{recommendation.project_name.replace(' ', '_')}_{timestamp}"
+        filepath = Path(output_path) / f"{stem}.md"
+
+        # Batch entries with the same (or same after the space swap) name are
+        # saved within the same second; number them rather than overwrite
+        suffix = 1
+        while filepath.exists():
+            suffix += 1
+            filepath = filepath.with_name(f"{stem}_{suffix}.md")
 
         # Ensure directory exists
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(filepath, "w") as f:
-            f.write(recommendation.executive_summary)
-            f.write("\n\n## Strategic Alignment Details\n\n")
-            f.write(recommendation.red_hat_alignment)
-            f.write("\n\n")
-            f.write(recommendation.ibm_alignment)
-            f.write("\n\n## IBM Research Consultation\n\n")
-            f.write(recommendation.raghu_consultation_notes)
-            f.write(f"\n\n## Analysis Metadata\n\n")
-            f.write(f"- **Generated**: {datetime.now().isoformat()}\n")
-            f.write(f"- **Analyst**: Jeremy Eder, Distinguished Engineer, Red Hat\n")
-            f.write(f"- **Recommendation**: {recommendation.recommendation}\n")
-            f.write(f"- **Confidence**: {recommendation.confidence}\n")
+        # Assemble the whole report and write it in one go
+        report = "".join(
+            [
+                recommendation.executive_summary,
+                "\n\n## Strategic Alignment Details\n\n",
+                recommendation.red_hat_alignment,
+                "\n\n",
+                recommendation.ibm_alignment,
+                "\n\n## IBM Research Consultation\n\n",
+                recommendation.raghu_consultation_notes,
+                "\n\n## Analysis Metadata\n\n",
+                f"- **Generated**: {now.isoformat()}\n",
+                "- **Analyst**: Jeremy Eder, Distinguished Engineer, Red Hat\n",
+                f"- **Recommendation**: {recommendation.recommendation}\n",
+                f"- **Confidence**: {recommendation.confidence}\n",
+            ]
+        )
+        filepath.write_text(report, encoding="utf-8")
 
         self.console.print(f"[green]Analysis saved to: {filepath}[/green]")
 
 
+def load_project_specs(path: str) -> List[Dict[str, str]]:
+    """Load batch analysis specs from a JSON list of project objects"""
+
+    try:
+        entries = orjson.loads(Path(path).read_bytes())
+    except (OSError, orjson.JSONDecodeError) as e:
+        raise click.BadParameter(str(e), param_hint="--projects-file")
+
+    if not isinstance(entries, list):
+        raise click.BadParameter(
+            "expected a JSON list of projects", param_hint="--projects-file"
+        )
+
+    specs = []
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict) or not all(
+            isinstance(entry.get(key), str) and entry[key]
+            for key in ("project_name", "github_url")
+        ):
+            raise click.BadParameter(
+                f"entry {index} needs project_name and github_url strings",
+                param_hint="--projects-file",
+            )
+        for key in ("description", "context"):
+            if entry.get(key) is not None and not isinstance(entry[key], str):
+                raise click.BadParameter(
+                    f"entry {index} has a non-string {key}",
+                    param_hint="--projects-file",
+                )
+        specs.append(
+            {
+                "project_name": entry["project_name"],
+                "github_url": entry["github_url"],
+                "description": entry.get("description") or "",
+                "context": entry.get("context") or "",
+            }
+        )
+    return specs
+
+
 @click.command()
-@click.argument("project_name")
-@click.argument("github_url")
+@click.argument("project_name", required=False)
+@click.argument("github_url", required=False)
 @click.option("--description", "-d", help="Project description")
 @click.option("--context", "-c", help="Additional context for the vote")
+@click.option(
+    "--projects-file",
+    "-f",
+    type=click.Path(exists=True, dir_okay=False),
+    help="JSON list of projects to analyze concurrently",
+)
 @click.option(
     "--output", "-o", default="./analysis", help="Output directory for analysis"
 )
 @click.option("--github-token", envvar="GITHUB_TOKEN", help="GitHub API token")
+@click.option(
+    "--quiet", "-q", is_flag=True, help="Only save the analysis, print nothing"
+)
 def main(
-    project_name: str,
-    github_url: str,
+    project_name: Optional[str],
+    github_url: Optional[str],
     description: str,
     context: str,
+    projects_file: Optional[str],
     output: str,
     github_token: str,
+    quiet: bool,
 ):
     """
     PyTorch TAC Voting Advisor
 
     Generates strategic voting recommendations for PyTorch Technical Advisory Committee decisions.
 
+    A batch of projects can be analyzed concurrently with --projects-file, a JSON
+    list of objects with project_name, github_url and optional description and
+    context fields.
+
     Examples:
         pytorch-tac-advisor "New ML Framework" "https://github.com/example/ml-framework"
         pytorch-tac-advisor "Inference Engine" "https://github.com/example/engine" -d "Fast inference for PyTorch models"
+        pytorch-tac-advisor --projects-file voting-round.json
     """
 
+    if projects_file:
+        if project_name or github_url:
+            raise click.UsageError(
+                "PROJECT_NAME and GITHUB_URL cannot be combined with --projects-file"
+            )
+        specs = load_project_specs(projects_file)
+    elif project_name and github_url:
+        specs = [
+            {
+                "project_name": project_name,
+                "github_url": github_url,
+                "description": description or "",
+                "context": context or "",
+            }
+        ]
+    else:
+        raise click.UsageError(
+            "PROJECT_NAME and GITHUB_URL are required unless --projects-file is given"
+        )
+
+    # Reject bad URLs before any network work starts
+    for index, spec in enumerate(specs):
+        try:
+            _parse_github_url(spec["github_url"])
+        except ValueError as e:
+            if projects_file:
+                raise click.BadParameter(
+                    f"entry {index}: {e}", param_hint="--projects-file"
+                )
+            raise click.BadParameter(str(e), param_hint="GITHUB_URL")
+
     async def run_analysis():
         console = Console()
 
         try:
             # Initialize advisor
-            advisor = PyTorchTACAdvisor()
+            async with PyTorchTACAdvisor(github_token, quiet=quiet) as advisor:
+                # Generate recommendations
+                results = await advisor.analyze_projects(specs)
 
-            # Generate recommendation
-            recommendation = await advisor.generate_voting_recommendation(
-                project_name=project_name,
-                github_url=github_url,
-                description=description or "",
-                context=context or "",
-            )
+                failed = False
+                for spec, result in zip(specs, results):
+                    if isinstance(result, Exception):
+                        console.print(
+                            f"[red]Error analyzing {spec['project_name']}: "
+                            f"{result}[/red]"
+                        )
+                        failed = True
+                        continue
+
+                    # Display results
+                    advisor.display_recommendation(result)
 
-            # Display results
-            advisor.display_recommendation(recommendation)
+                    # Save analysis
+                    advisor.save_analysis(result, output)
 
-            # Save analysis
-            advisor.save_analysis(recommendation, output)
+            if failed:
+                sys.exit(1)
 
         except KeyboardInterrupt:
             console.print("\n[yellow]Analysis interrupted by user[/yellow]")
@@ -757,8 +1466,15 @@ def main(
             console.print(f"[red]Error during analysis: {str(e)}[/red]")
             sys.exit(1)
 
-    # Run the async analysis
-    asyncio.run(run_analysis())
+    # Run the async analysis, on uvloop's faster event loop where available
+    try:
+        import uvloop
+
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+
+    run(run_analysis())
 
 
 if __name__ == "__main__":